@@ -14,6 +14,8 @@ from .core import (
     ObjectSchema,
     UnionSchema,
     deduce_schema,
+    deduce_schema_parallel,
+    deduce_schema_iter,
     coerce_to_schema,
     schema_repr,
 )
@@ -33,6 +35,8 @@ __all__ = [
     "ObjectSchema",
     "UnionSchema",
     "deduce_schema",
+    "deduce_schema_parallel",
+    "deduce_schema_iter",
     "coerce_to_schema",
     "schema_repr",
 ]
@@ -1,30 +1,182 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Any, Dict, Mapping, Sequence, Set, Tuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import reduce, wraps
+from itertools import islice, repeat
+from typing import Any, Callable, Collection, Dict, FrozenSet, Iterable, Mapping, Sequence, Set, Tuple
 from datetime import date, datetime
+import copy
 import math
+import sys
+import threading
+
+# ------------------------------
+# Memoization
+# ------------------------------
+
+_MERGE_CACHE_SIZE = 4096
+# (id(a), id(b)) -> (a, b, merged). Holding a and b keeps their ids from being reused.
+_MERGE_CACHE: OrderedDict[Tuple[int, int], Tuple[Schema, Schema, Schema]] = OrderedDict()
+_MERGE_CACHE_LOCK = threading.Lock()
+
+def _memoize_merge(fn: Callable[[Schema, Schema], Schema]) -> Callable[[Schema, Schema], Schema]:
+    """Cache merge results by operand identity (schemas are immutable), LRU-bounded.
+    Self-merges and leaf/leaf merges are cheaper than the lookup and bypass the cache.
+    """
+    @wraps(fn)
+    def merge(self: Schema, other: Schema) -> Schema:
+        if self is other:
+            return self
+        if isinstance(self, _LeafSchema) and isinstance(other, _LeafSchema):
+            return fn(self, other)  # the two-variant fast path beats a cache lookup
+        key = (id(self), id(other))
+        with _MERGE_CACHE_LOCK:
+            hit = _MERGE_CACHE.get(key)
+            if hit is not None:
+                _MERGE_CACHE.move_to_end(key)
+                return hit[2]
+        result = fn(self, other)  # outside the lock: merges recurse into merge()
+        with _MERGE_CACHE_LOCK:
+            _MERGE_CACHE[key] = (self, other, result)
+            if len(_MERGE_CACHE) > _MERGE_CACHE_SIZE:
+                _MERGE_CACHE.popitem(last=False)
+        return result
+    return merge
+
+def _cached_on_instance(attr: str) -> Callable[[Callable[[Any], Any]], Callable[[Any], Any]]:
+    """Compute a no-argument method once per (immutable) schema and keep it under `attr`."""
+    def decorate(fn: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        @wraps(fn)
+        def method(self: Any) -> Any:
+            try:
+                return getattr(self, attr)
+            except AttributeError:
+                result = fn(self)
+                object.__setattr__(self, attr, result)  # bypass frozen=True
+                return result
+        return method
+    return decorate
+
+# ------------------------------
+# Read-only containers
+# ------------------------------
+
+class _FrozenDict(dict):
+    """A dict that refuses mutation; still a dict for json, == and isinstance."""
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("read-only mapping; use copy.deepcopy() for a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+class _FrozenList(list):
+    """A list that refuses mutation; still a list for json, == and isinstance."""
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("read-only list; use copy.deepcopy() for a mutable copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> list:
+        return [copy.deepcopy(v, memo) for v in self]
+
+def _freeze(obj: Any) -> Any:
+    """Recursively turn plain dicts/lists into read-only ones (frozen parts are kept as is)."""
+    if type(obj) is dict:
+        return _FrozenDict({k: _freeze(v) for k, v in obj.items()})
+    if type(obj) is list:
+        return _FrozenList([_freeze(v) for v in obj])
+    return obj
+
+def _cached_jsonschema(fn: Callable[[Any], Dict[str, Any]]) -> Callable[[Any], Dict[str, Any]]:
+    """Build a composite's JSON-Schema dict once. The cached tree is shared by every caller
+    and embedded in parent schemas' dicts, so it is frozen; callers get a fresh top-level
+    dict over the frozen nested parts.
+    """
+    @_cached_on_instance("_js")
+    def frozen(self: Any) -> Dict[str, Any]:
+        return _freeze(fn(self))
+
+    @wraps(fn)
+    def to_jsonschema(self: Any) -> Dict[str, Any]:
+        return dict(frozen(self))
+    return to_jsonschema
 
 # ------------------------------
 # Schema model
 # ------------------------------
 
+# slots=True (3.10+) drops the per-instance __dict__ of every schema.
+_schema_dataclass = (
+    dataclass(frozen=True, slots=True) if sys.version_info >= (3, 10) else dataclass(frozen=True)
+)
+
+def _rebuild_schema(cls: type, kwargs: Dict[str, Any]) -> "Schema":
+    """Unpickle helper for Schema.__reduce_ex__."""
+    return cls(**kwargs)
+
 class Schema:
     """Base class for schemas."""
+    __slots__ = ("_js", "_repr", "_dispatch", "_hash")  # lazily filled caches, see _cached_on_instance
+
+    @_memoize_merge
     def merge(self, other: "Schema") -> "Schema":
+        return self._union_with(other)
+
+    def __reduce_ex__(self, protocol: int):
+        # Rebuild dataclass schemas from their init fields only: the lazily filled cache
+        # slots must not be restored (without slots=True, i.e. before 3.10, that hits the
+        # frozen __setattr__). Other subclasses keep the default protocol.
+        if not is_dataclass(self):
+            return super().__reduce_ex__(protocol)
+        kwargs = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        return (_rebuild_schema, (type(self), kwargs))
+
+    def _union_with(self, other: "Schema") -> "Schema":
+        """Uncached base merge: equal schemas collapse, anything else becomes a union."""
         if self == other:
             return self
         return UnionSchema.of(self, other)
 
     def to_jsonschema(self) -> Dict[str, Any]:
-        """Return a JSON-Schema-like dict (draft-ish) for interop."""
+        """Return a JSON-Schema-like dict (draft-ish) for interop.
+        The top-level dict is always a fresh, editable dict; nested parts of composite
+        schemas are cached and read-only (mutation raises TypeError), use copy.deepcopy()
+        for a fully editable copy.
+        """
         raise NotImplementedError
 
     def coerce(self, value: Any) -> Any:
         """Attempt to coerce a value into this schema (best-effort, may raise)."""
         return value  # defaults to identity
 
-@dataclass(frozen=True)
-class NullSchema(Schema):
+class _LeafSchema(Schema):
+    """Base for field-less schemas; each concrete class has a single shared instance."""
+    __slots__ = ()
+
+    def __new__(cls):
+        inst = cls.__dict__.get("_instance")
+        if inst is None:
+            inst = super().__new__(cls)
+            cls._instance = inst
+        return inst
+
+@_schema_dataclass
+class NullSchema(_LeafSchema):
     def __repr__(self): return "Null"
     def to_jsonschema(self): return {"type": "null"}
     def coerce(self, value: Any) -> Any:
@@ -32,14 +184,17 @@ class NullSchema(Schema):
             return None
         raise TypeError("Cannot coerce non-null to null")
 
-@dataclass(frozen=True)
-class BoolSchema(Schema):
+_NULL = NullSchema()
+
+@_schema_dataclass
+class BoolSchema(_LeafSchema):
     def __repr__(self): return "Bool"
     def to_jsonschema(self): return {"type": "boolean"}
     def coerce(self, value: Any) -> Any:
-        if isinstance(value, bool):
+        t = type(value)
+        if t is bool:
             return value
-        if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if t is int or t is float or isinstance(value, (int, float)):
             return bool(value)
         if isinstance(value, str):
             v = value.strip().lower()
@@ -47,17 +202,20 @@ class BoolSchema(Schema):
             if v in {"false", "f", "0", "no", "n"}: return False
         raise TypeError(f"Cannot coerce {value!r} to bool")
 
-@dataclass(frozen=True)
-class IntSchema(Schema):
+_BOOL = BoolSchema()
+
+@_schema_dataclass
+class IntSchema(_LeafSchema):
     def __repr__(self): return "Int"
     def to_jsonschema(self): return {"type": "integer"}
     def coerce(self, value: Any) -> Any:
-        if isinstance(value, bool):
+        t = type(value)
+        if t is bool:
             # Avoid bool-as-int surprises
             raise TypeError("Bool is not accepted as Int")
-        if isinstance(value, int):
+        if t is int or isinstance(value, int):
             return value
-        if isinstance(value, float) and value.is_integer():
+        if (t is float or isinstance(value, float)) and value.is_integer():
             return int(value)
         if isinstance(value, str):
             s = value.strip()
@@ -65,14 +223,17 @@ class IntSchema(Schema):
                 return int(s)
         raise TypeError(f"Cannot coerce {value!r} to int")
 
-@dataclass(frozen=True)
-class FloatSchema(Schema):
+_INT = IntSchema()
+
+@_schema_dataclass
+class FloatSchema(_LeafSchema):
     def __repr__(self): return "Float"
     def to_jsonschema(self): return {"type": "number"}
     def coerce(self, value: Any) -> Any:
-        if isinstance(value, bool):
+        t = type(value)
+        if t is bool:
             raise TypeError("Bool is not accepted as Float")
-        if isinstance(value, (int, float)):
+        if t is float or t is int or isinstance(value, (int, float)):
             return float(value)
         if isinstance(value, str):
             try:
@@ -83,8 +244,10 @@ class FloatSchema(Schema):
                 pass
         raise TypeError(f"Cannot coerce {value!r} to float")
 
-@dataclass(frozen=True)
-class StringSchema(Schema):
+_FLOAT = FloatSchema()
+
+@_schema_dataclass
+class StringSchema(_LeafSchema):
     def __repr__(self): return "String"
     def to_jsonschema(self): return {"type": "string"}
     def coerce(self, value: Any) -> Any:
@@ -92,13 +255,17 @@ class StringSchema(Schema):
             return None  # passthrough; caller decides if Null allowed
         return str(value)
 
-@dataclass(frozen=True)
-class BytesSchema(Schema):
+_STR = StringSchema()
+
+@_schema_dataclass
+class BytesSchema(_LeafSchema):
     def __repr__(self): return "Bytes"
     def to_jsonschema(self): return {"type": "string", "contentEncoding": "base64"}
 
-@dataclass(frozen=True)
-class DateSchema(Schema):
+_BYTES = BytesSchema()
+
+@_schema_dataclass
+class DateSchema(_LeafSchema):
     def __repr__(self): return "Date"
     def to_jsonschema(self): return {"type": "string", "format": "date"}
     def coerce(self, value: Any) -> Any:
@@ -106,8 +273,10 @@ class DateSchema(Schema):
             return value
         raise TypeError(f"Cannot coerce {value!r} to date")
 
-@dataclass(frozen=True)
-class DateTimeSchema(Schema):
+_DATE = DateSchema()
+
+@_schema_dataclass
+class DateTimeSchema(_LeafSchema):
     def __repr__(self): return "DateTime"
     def to_jsonschema(self): return {"type": "string", "format": "date-time"}
     def coerce(self, value: Any) -> Any:
@@ -115,49 +284,66 @@ class DateTimeSchema(Schema):
             return value
         raise TypeError(f"Cannot coerce {value!r} to datetime")
 
-@dataclass(frozen=True)
+_DT = DateTimeSchema()
+
+@_schema_dataclass
 class ArraySchema(Schema):
     items: Schema
     kind: str = "list"  # "list", "tuple", or "set"
     def __repr__(self): return f"{self.kind.capitalize()}[{self.items!r}]"
+    @_cached_jsonschema
     def to_jsonschema(self):
         js = {"type": "array", "items": self.items.to_jsonschema()}
         if self.kind == "set":
             js["uniqueItems"] = True
         return js
+    @_memoize_merge
     def merge(self, other: Schema) -> Schema:
         if isinstance(other, ArraySchema) and self.kind == other.kind:
             return ArraySchema(items=self.items.merge(other.items), kind=self.kind)
-        return super().merge(other)
+        return self._union_with(other)
     def coerce(self, value: Any) -> Any:
+        c = self.items.coerce
         if self.kind == "list" and isinstance(value, list):
-            return [self.items.coerce(v) for v in value]
+            return list(map(c, value))
         if self.kind == "tuple" and isinstance(value, (list, tuple)):
-            return tuple(self.items.coerce(v) for v in value)
+            return tuple(map(c, value))
         if self.kind == "set" and isinstance(value, (list, set, tuple)):
-            return {self.items.coerce(v) for v in value}
+            return set(map(c, value))
         raise TypeError(f"Cannot coerce {type(value).__name__} to {self.kind}")
 
-@dataclass(frozen=True)
+@_schema_dataclass
 class MapSchema(Schema):
     key: Schema
     value: Schema
     def __repr__(self): return f"Map[{self.key!r} → {self.value!r}]"
+    @_cached_jsonschema
     def to_jsonschema(self):
         return {
             "type": "object",
             "additionalProperties": self.value.to_jsonschema()
         }
+    @_memoize_merge
     def merge(self, other: Schema) -> Schema:
         if isinstance(other, MapSchema):
             return MapSchema(self.key.merge(other.key), self.value.merge(other.value))
-        return super().merge(other)
+        return self._union_with(other)
 
-@dataclass(frozen=True)
+@_schema_dataclass
 class ObjectSchema(Schema):
-    properties: Dict[str, Schema] = field(default_factory=dict)
-    optional: Set[str] = field(default_factory=set)  # fields that may be missing / null
+    properties: Mapping[str, Schema] = field(default_factory=dict)
+    optional: FrozenSet[str] = frozenset()  # fields that may be missing / null
+
+    def __post_init__(self):
+        # Freeze the containers so the instance is really immutable (and hashable).
+        object.__setattr__(self, "properties", _FrozenDict(self.properties))
+        object.__setattr__(self, "optional", frozenset(self.optional))
+
+    @_cached_on_instance("_hash")
+    def __hash__(self):
+        return hash((frozenset(self.properties.items()), self.optional))
 
+    @_cached_on_instance("_repr")
     def __repr__(self):
         parts = []
         for k in sorted(self.properties):
@@ -165,6 +351,26 @@ class ObjectSchema(Schema):
             parts.append(f"{k}{opt}: {self.properties[k]!r}")
         return "{" + ", ".join(parts) + "}"
 
+    @staticmethod
+    def from_samples(samples: Sequence[Mapping[str, Any]]) -> "ObjectSchema":
+        """Infer one object schema from many string-keyed mappings, column by column.
+        Equivalent to merging the per-sample schemas, without the intermediate objects.
+        """
+        columns: Dict[str, list[Any]] = {}
+        optional: Set[str] = set()
+        for sample in samples:
+            for k, v in sample.items():
+                columns.setdefault(k, []).append(v)
+                if v is None:
+                    optional.add(k)
+        props: Dict[str, Schema] = {}
+        for k, col in columns.items():
+            if len(col) < len(samples):
+                optional.add(k)
+            props[k] = deduce_schema(col)
+        return ObjectSchema(props, optional)
+
+    @_cached_jsonschema
     def to_jsonschema(self):
         required = [k for k in self.properties if k not in self.optional]
         return {
@@ -174,22 +380,21 @@ class ObjectSchema(Schema):
             "additionalProperties": False,
         }
 
+    @_memoize_merge
     def merge(self, other: Schema) -> Schema:
         if not isinstance(other, ObjectSchema):
-            return super().merge(other)
-        keys = set(self.properties) | set(other.properties)
-        props: Dict[str, Schema] = {}
-        optional: Set[str] = set()
-        for k in keys:
-            if k in self.properties and k in other.properties:
-                props[k] = self.properties[k].merge(other.properties[k])
-            elif k in self.properties:
-                props[k] = self.properties[k]
-                optional.add(k)
+            return self._union_with(other)
+        props: Dict[str, Schema] = dict(self.properties)
+        optional: Set[str] = set(self.optional) | other.optional
+        for k, v in other.properties.items():
+            if k in props:
+                props[k] = props[k].merge(v)
             else:
-                props[k] = other.properties[k]
+                props[k] = v
+                optional.add(k)
+        for k in self.properties:
+            if k not in other.properties:
                 optional.add(k)
-        optional |= self.optional | other.optional
         return ObjectSchema(props, optional)
 
     def coerce(self, value: Any) -> Any:
@@ -208,97 +413,250 @@ class ObjectSchema(Schema):
                 raise KeyError(f"Missing required field: {k}")
         return out
 
-@dataclass(frozen=True)
+@_schema_dataclass
 class UnionSchema(Schema):
     variants: Tuple[Schema, ...]
+    @_cached_on_instance("_repr")
     def __repr__(self):
         return " | ".join(repr(v) for v in self.variants)
 
-    @staticmethod
-    def _flatten(s: Schema, acc: list[Schema]) -> None:
-        if isinstance(s, UnionSchema):
-            for v in s.variants:
-                UnionSchema._flatten(v, acc)
-        else:
-            acc.append(s)
-
     @staticmethod
     def of(*schemas: Schema) -> Schema:
-        flat: list[Schema] = []
-        for s in schemas:
-            UnionSchema._flatten(s, flat)
-        uniq: Dict[str, Schema] = {repr(s): s for s in flat}
-        has_int = any(isinstance(s, IntSchema) for s in uniq.values())
-        has_float = any(isinstance(s, FloatSchema) for s in uniq.values())
-        if has_int and has_float:
-            uniq = {k: v for k, v in uniq.items() if not isinstance(v, IntSchema)}
-        if len(uniq) == 1:
-            return next(iter(uniq.values()))
-        ordered = sorted(uniq.values(), key=lambda s: repr(s))
-        return UnionSchema(tuple(ordered))
-
+        if len(schemas) == 2:
+            # Pairwise merges of two plain schemas skip flatten/dedupe/sort.
+            a, b = schemas
+            ra, rb = _TYPE_ORDER.get(type(a)), _TYPE_ORDER.get(type(b))
+            if ra is not None and rb is not None:
+                if a is b or a == b:
+                    return a
+                if ra != rb:
+                    if (ra, rb) == (_INT_RANK, _FLOAT_RANK):
+                        return b
+                    if (ra, rb) == (_FLOAT_RANK, _INT_RANK):
+                        return a
+                    return UnionSchema((a, b) if ra < rb else (b, a))
+        # Flatten nested unions and dedupe by repr in one pass (repr is cached on composites).
+        uniq: Dict[str, Schema] = {}
+        stack = list(schemas)
+        while stack:
+            s = stack.pop()
+            if isinstance(s, UnionSchema):
+                stack.extend(s.variants)
+            else:
+                uniq[repr(s)] = s
+        variants = list(uniq.values())
+        if any(isinstance(s, FloatSchema) for s in variants):
+            variants = [s for s in variants if not isinstance(s, IntSchema)]
+        if len(variants) == 1:
+            return variants[0]
+        return UnionSchema(_ordered(variants))
+
+    @_cached_jsonschema
     def to_jsonschema(self):
         return {"anyOf": [v.to_jsonschema() for v in self.variants]}
 
+    @_cached_on_instance("_dispatch")
+    def _dispatch_table(self) -> Dict[type, int]:
+        """Exact scalar type -> index of the first variant whose coerce may accept it.
+        Every earlier variant is known to reject that type.
+        """
+        table: Dict[type, int] = {}
+        for i, v in enumerate(self.variants):
+            for t in _COERCE_ACCEPTS.get(type(v), _ANY_SCALAR):
+                table.setdefault(t, i)
+        return table
+
+# Canonical variant order inside a union; unknown Schema subclasses sort last.
+# coerce_to_schema tries variants in this order, so strict coercers come first and
+# the accept-anything ones (Map and Bytes pass values through, String stringifies) last.
+_TYPE_ORDER: Dict[type, int] = {
+    NullSchema: 0,
+    BoolSchema: 1,
+    IntSchema: 2,
+    FloatSchema: 3,
+    DateSchema: 4,
+    DateTimeSchema: 5,
+    ArraySchema: 6,
+    ObjectSchema: 7,
+    MapSchema: 8,
+    BytesSchema: 9,
+    StringSchema: 10,
+}
+_INT_RANK = _TYPE_ORDER[IntSchema]
+_FLOAT_RANK = _TYPE_ORDER[FloatSchema]
+
+def _ordered(variants: list[Schema]) -> Tuple[Schema, ...]:
+    """Sort union variants by type rank; repr only breaks ties between same-class variants."""
+    ranks = [_TYPE_ORDER.get(type(s), len(_TYPE_ORDER)) for s in variants]
+    if len(set(ranks)) == len(ranks):
+        return tuple(s for _, s in sorted(zip(ranks, variants), key=lambda p: p[0]))
+    return tuple(sorted(variants, key=lambda s: (_TYPE_ORDER.get(type(s), len(_TYPE_ORDER)), repr(s))))
+
 # ------------------------------
 # Inference
 # ------------------------------
 
+# Exact Python types whose schema is a leaf singleton (subclasses go through _infer_single).
+_LEAF_TYPES: Dict[type, Schema] = {
+    type(None): _NULL,
+    bool: _BOOL,
+    int: _INT,
+    float: _FLOAT,
+    str: _STR,
+    bytes: _BYTES,
+    bytearray: _BYTES,
+    memoryview: _BYTES,
+    date: _DATE,
+    datetime: _DT,
+}
+
+# Below this many samples the per-element loop is as fast as a type-set pass.
+_FASTPATH_MIN = 256
+
+def _scalar_fastpath(values: Collection[Any]) -> Schema | None:
+    """Infer a scalar column from its set of exact value types, or None if it isn't one."""
+    if len(values) <= _FASTPATH_MIN or type(next(iter(values))) not in _LEAF_TYPES:
+        return None
+    schemas = []
+    for t in set(map(type, values)):
+        s = _LEAF_TYPES.get(t)
+        if s is None:
+            return None
+        schemas.append(s)
+    return UnionSchema.of(*schemas)
+
+def _is_record(value: Any) -> bool:
+    """True for mappings that infer as ObjectSchema (all keys are strings)."""
+    # map/repeat keeps the per-key check in C and still stops at the first non-str key.
+    return isinstance(value, Mapping) and all(map(isinstance, value, repeat(str)))
+
+def _infer_mapping(value: Mapping) -> Schema:
+    if _is_record(value):
+        props: Dict[str, Schema] = {}
+        optional: Set[str] = set()
+        for k, v in value.items():
+            if v is None:
+                optional.add(k)
+                props[k] = _NULL
+            else:
+                props[k] = _infer_single(v)
+        return ObjectSchema(props, optional)
+    key_s: Schema | None = None
+    val_s: Schema | None = None
+    for k, v in value.items():
+        ks = _infer_single(k)
+        vs = _infer_single(v)
+        key_s = ks if key_s is None else key_s.merge(ks)
+        val_s = vs if val_s is None else val_s.merge(vs)
+    if key_s is None:
+        return MapSchema(_STR, _NULL)
+    return MapSchema(key_s, val_s if val_s is not None else _NULL)
+
+def _infer_items(value: Any, kind: str) -> Schema:
+    fast = _scalar_fastpath(value)
+    if fast is not None:
+        return ArraySchema(fast, kind=kind)
+    item_schema: Schema | None = None
+    for item in value:
+        s = _infer_single(item)
+        item_schema = s if item_schema is None else item_schema.merge(s)
+    if item_schema is None:
+        item_schema = _NULL
+    return ArraySchema(item_schema, kind=kind)
+
+# Exact container types -> inference handler (subclasses go through the isinstance chain).
+_DISPATCH: Dict[type, Callable[[Any], Schema]] = {
+    dict: _infer_mapping,
+    list: lambda v: _infer_items(v, "list"),
+    tuple: lambda v: _infer_items(v, "tuple"),
+    set: lambda v: _infer_items(v, "set"),
+    frozenset: lambda v: _infer_items(v, "set"),
+}
+
 def _infer_single(value: Any) -> Schema:
-    if value is None:
-        return NullSchema()
+    t = type(value)
+    leaf = _LEAF_TYPES.get(t)
+    if leaf is not None:
+        return leaf
+    handler = _DISPATCH.get(t)
+    if handler is not None:
+        return handler(value)
+
     if isinstance(value, bool):
-        return BoolSchema()
-    if isinstance(value, int) and not isinstance(value, bool):
-        return IntSchema()
+        return _BOOL
+    if isinstance(value, int):
+        return _INT
     if isinstance(value, float):
-        return FloatSchema()
+        return _FLOAT
     if isinstance(value, (str,)):
-        return StringSchema()
+        return _STR
     if isinstance(value, (bytes, bytearray, memoryview)):
-        return BytesSchema()
+        return _BYTES
     if isinstance(value, datetime):
-        return DateTimeSchema()
+        return _DT
     if isinstance(value, date):
-        return DateSchema()
+        return _DATE
 
     if isinstance(value, Mapping):
-        if all(isinstance(k, str) for k in value.keys()):
-            props: Dict[str, Schema] = {}
-            optional: Set[str] = set()
-            for k, v in value.items():
-                if v is None:
-                    optional.add(k)
-                    props[k] = NullSchema()
-                else:
-                    props[k] = _infer_single(v)
-            return ObjectSchema(props, optional)
-        else:
-            key_s: Schema | None = None
-            val_s: Schema | None = None
-            for k, v in value.items():
-                ks = _infer_single(k)
-                vs = _infer_single(v)
-                key_s = ks if key_s is None else key_s.merge(ks)
-                val_s = vs if val_s is None else val_s.merge(vs)
-            if key_s is None:
-                return MapSchema(StringSchema(), NullSchema())
-            return MapSchema(key_s, val_s if val_s is not None else NullSchema())
+        return _infer_mapping(value)
 
     if isinstance(value, (list, tuple, set, frozenset)):
         kind = "list" if isinstance(value, list) else "tuple" if isinstance(value, tuple) else "set"
-        item_schema: Schema | None = None
-        for item in value:
-            s = _infer_single(item)
-            item_schema = s if item_schema is None else item_schema.merge(s)
-        if item_schema is None:
-            item_schema = NullSchema()
-        return ArraySchema(item_schema, kind=kind)
+        return _infer_items(value, kind)
 
     if hasattr(value, "__dict__"):
         return _infer_single(vars(value))
 
-    return StringSchema()
+    return _STR
+
+_NO_VALUE = object()
+
+# After this many consecutive no-op merges, scalars the schema already covers are skipped.
+_STABLE_RUN = 8
+
+def _leaf_covers(schema: Schema, value_type: type) -> bool:
+    """True if merging a value of exact type `value_type` cannot change `schema`."""
+    leaf = _LEAF_TYPES.get(value_type)
+    if leaf is None:
+        return False
+    if schema is leaf or (leaf is _INT and schema is _FLOAT):
+        return True
+    if type(schema) is UnionSchema:
+        variants = schema.variants
+        return leaf in variants or (leaf is _INT and _FLOAT in variants)
+    return False
+
+def deduce_schema_iter(values: Iterable[Any]) -> Schema:
+    """Infer a schema from any iterable (e.g. a generator over ndjson rows) in one pass,
+    without materializing it. Returns Null for an empty or all-None input.
+    """
+    it = iter(values)
+    first = next(it, _NO_VALUE)
+    if first is _NO_VALUE:
+        return _NULL
+    t0 = type(first)
+    merged = _LEAF_TYPES.get(t0)
+    if merged is None:
+        merged = _infer_single(first)
+    else:
+        # Same-typed scalar runs need no per-element inference or merging.
+        for v in it:
+            if type(v) is not t0:
+                merged = merged.merge(_infer_single(v))
+                break
+        else:
+            return merged
+    stable = 0
+    for v in it:
+        if stable >= _STABLE_RUN and _leaf_covers(merged, type(v)):
+            continue
+        nxt = merged.merge(_infer_single(v))
+        if nxt is merged or nxt == merged:
+            stable += 1  # keep the old instance so merge-cache hits stay possible
+        else:
+            merged = nxt
+            stable = 0
+    return merged
 
 def deduce_schema(values: Sequence[Any]) -> Schema:
     """Infer a schema from a list/sequence of Python objects.
@@ -306,27 +664,61 @@ def deduce_schema(values: Sequence[Any]) -> Schema:
     - Otherwise, merges types across all samples.
     """
     if not values:
-        return NullSchema()
-    merged: Schema | None = None
-    all_null = True
-    for v in values:
-        s = _infer_single(v)
-        if not isinstance(s, NullSchema):
-            all_null = False
-        merged = s if merged is None else merged.merge(s)
-    return NullSchema() if all_null else merged
+        return _NULL
+    fast = _scalar_fastpath(values)
+    if fast is not None:
+        return fast
+    if all(_is_record(v) for v in values):
+        return ObjectSchema.from_samples(values)
+    return deduce_schema_iter(values)
+
+def deduce_schema_parallel(values: Sequence[Any], workers: int | None = None, chunk: int = 50_000) -> Schema:
+    """Infer chunks of `chunk` values in worker processes and merge the partial schemas.
+    Inputs of up to 4 * chunk values are inferred in-process, where IPC would dominate.
+    Values must be picklable.
+
+    For scalars and (nested) records the result equals deduce_schema's. merge is
+    order-sensitive once a union holds several container variants (List[Int] | Tuple[Int]
+    merged with List[Null] keeps List[Null] separate), so such unions may be grouped
+    differently depending on chunk boundaries.
+    """
+    if chunk <= 0:
+        raise ValueError(f"chunk must be positive, got {chunk}")
+    if len(values) <= 4 * chunk:
+        return deduce_schema(values)
+    it = iter(values)
+    chunks = iter(lambda: list(islice(it, chunk)), [])
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partials = list(pool.map(deduce_schema, chunks))
+    return reduce(lambda a, b: a.merge(b), partials)
 
 # ------------------------------
 # Mapping/coercion utilities
 # ------------------------------
 
+# Exact scalar types each schema's coerce might accept; it always raises for the other
+# scalar types. Schemas missing here (String, Bytes, Map, unknown) may accept anything.
+_ANY_SCALAR = frozenset(_LEAF_TYPES)
+_COERCE_ACCEPTS: Dict[type, frozenset] = {
+    NullSchema: frozenset({type(None)}),
+    BoolSchema: frozenset({bool, int, float, str}),
+    IntSchema: frozenset({int, float, str}),
+    FloatSchema: frozenset({int, float, str}),
+    DateSchema: frozenset({date}),
+    DateTimeSchema: frozenset({datetime}),
+    ArraySchema: frozenset(),
+    ObjectSchema: frozenset(),
+}
+
 def coerce_to_schema(value: Any, schema: Schema) -> Any:
     """Attempt to coerce/map a Python value into the given schema recursively.
-    For UnionSchema, tries each variant in order.
+    For UnionSchema, tries each variant in order, skipping variants known to reject
+    the value's exact scalar type.
     """
     if isinstance(schema, UnionSchema):
+        start = schema._dispatch_table().get(type(value), 0)
         last_err = None
-        for variant in schema.variants:
+        for variant in schema.variants[start:]:
             try:
                 return coerce_to_schema(value, variant)
             except Exception as e:  # noqa: BLE001 - keep simple for library
@@ -0,0 +1,20 @@
+from datetime import date, datetime
+
+from schema_infer import coerce_to_schema, deduce_schema
+
+
+def test_union_tries_strict_variants_before_string():
+    d = date(2020, 1, 1)
+    assert coerce_to_schema(d, deduce_schema(["x", d])) == d
+    dt = datetime(2020, 1, 1, 12, 0)
+    assert coerce_to_schema(dt, deduce_schema(["x", dt])) == dt
+    assert coerce_to_schema([1, 2], deduce_schema(["x", [1]])) == [1, 2]
+    assert coerce_to_schema(b"ab", deduce_schema(["x", b"y"])) == b"ab"
+    assert coerce_to_schema({1: 2}, deduce_schema(["x", {1: 2}])) == {1: 2}
+    assert coerce_to_schema({"a": 1}, deduce_schema(["x", {"a": 1}])) == {"a": 1}
+    assert coerce_to_schema("x", deduce_schema(["x", [1], date(2020, 1, 1)])) == "x"
+
+
+def test_union_variant_order():
+    schema = deduce_schema(["x", b"y", {1: 2}, {"a": 1}, [1], date(2020, 1, 1), 1, None])
+    assert repr(schema) == "Null | Int | Date | List[Int] | {a: Int} | Map[Int → Int] | Bytes | String"
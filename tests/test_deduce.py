@@ -0,0 +1,110 @@
+from functools import reduce
+
+import pytest
+
+from schema_infer import (
+    ArraySchema,
+    FloatSchema,
+    IntSchema,
+    NullSchema,
+    ObjectSchema,
+    Schema,
+    StringSchema,
+    UnionSchema,
+    deduce_schema,
+    deduce_schema_iter,
+)
+from schema_infer.core import _STABLE_RUN
+
+
+def _merged(samples):
+    # Reference result: merge the per-sample schemas one by one.
+    return reduce(lambda a, b: a.merge(b), (deduce_schema([s]) for s in samples))
+
+
+def test_from_samples_missing_key_is_optional():
+    samples = [{"a": 1, "b": "x"}, {"a": 2}]
+    schema = ObjectSchema.from_samples(samples)
+    assert schema == ObjectSchema({"a": IntSchema(), "b": StringSchema()}, {"b"})
+    assert schema == _merged(samples) == deduce_schema(samples)
+
+
+def test_from_samples_none_value_is_optional():
+    samples = [{"a": 1, "b": None}, {"a": 2, "b": "x"}]
+    schema = ObjectSchema.from_samples(samples)
+    assert schema.optional == {"b"}
+    assert schema.properties["b"] == UnionSchema.of(NullSchema(), StringSchema())
+    assert schema == _merged(samples)
+
+
+def test_from_samples_nested_record_column():
+    samples = [{"a": {"x": 1, "y": [1]}}, {"a": {"x": 2}}]
+    schema = ObjectSchema.from_samples(samples)
+    inner = ObjectSchema({"x": IntSchema(), "y": ArraySchema(IntSchema())}, {"y"})
+    assert schema == ObjectSchema({"a": inner}, set())
+    assert schema == _merged(samples)
+
+
+def test_from_samples_column_mixing_records_and_scalars():
+    samples = [{"a": {"x": 1}}, {"a": 5}, {"a": "s"}]
+    schema = ObjectSchema.from_samples(samples)
+    assert schema.properties["a"] == UnionSchema.of(
+        ObjectSchema({"x": IntSchema()}, set()), IntSchema(), StringSchema()
+    )
+    assert schema == _merged(samples)
+
+
+def test_iter_consumes_generator_once():
+    pulled = []
+
+    def rows():
+        for i in range(20):
+            pulled.append(i)
+            yield {"a": i, "b": None if i % 2 else "x"}
+
+    gen = rows()
+    values = [{"a": i, "b": None if i % 2 else "x"} for i in range(20)]
+    assert deduce_schema_iter(gen) == deduce_schema(values)
+    assert pulled == list(range(20))
+    assert list(gen) == []
+
+
+def test_iter_empty_and_all_none_is_null():
+    assert deduce_schema_iter(iter(())) == NullSchema()
+    assert deduce_schema_iter(None for _ in range(5)) == NullSchema()
+
+
+def test_iter_type_switch_after_same_type_run():
+    values = [1, 1, 1, "x", 1, 2.5]
+    assert deduce_schema_iter(iter(values)) == deduce_schema(values)
+    assert repr(deduce_schema_iter(iter(values))) == "Float | String"
+
+
+@pytest.mark.parametrize(
+    "tail, expected",
+    [
+        (3, "Float | String"),  # an int is absorbed by the Float variant
+        (b"z", "Float | Bytes | String"),  # a type the schema does not cover yet
+    ],
+)
+def test_iter_skip_after_stable_run_matches_plain_merge(tail, expected):
+    values = [1.5, "x"] + [2.5, "y"] * (_STABLE_RUN + 2) + [tail]
+    schema = deduce_schema_iter(iter(values))
+    assert schema == _merged(values) == deduce_schema(values)
+    assert repr(schema) == expected
+
+
+class Email(Schema):
+    def __repr__(self):
+        return "Email"
+
+
+class Count(IntSchema):
+    pass
+
+
+def test_union_of_subclasses():
+    assert repr(UnionSchema.of(Email(), Email())) == "Email"
+    assert UnionSchema.of(Count(), FloatSchema(), StringSchema()) == UnionSchema.of(
+        FloatSchema(), StringSchema()
+    )
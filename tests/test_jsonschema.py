@@ -0,0 +1,64 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from schema_infer import deduce_schema
+
+
+def _schema():
+    return deduce_schema([{"a": 1, "b": [1.5]}, {"a": "x"}, None])
+
+
+def test_to_jsonschema_is_plain_json():
+    js = _schema().to_jsonschema()
+    assert js == {
+        "anyOf": [
+            {"type": "null"},
+            {
+                "type": "object",
+                "properties": {
+                    "a": {"anyOf": [{"type": "integer"}, {"type": "string"}]},
+                    "b": {"type": "array", "items": {"type": "number"}},
+                },
+                "required": ["a"],
+                "additionalProperties": False,
+            },
+        ]
+    }
+    assert isinstance(js, dict) and isinstance(js["anyOf"], list)
+    assert json.loads(json.dumps(js)) == js
+    assert pickle.loads(pickle.dumps(js)) == js
+
+
+def test_to_jsonschema_cannot_be_corrupted():
+    schema = _schema()
+    js = schema.to_jsonschema()
+    with pytest.raises(TypeError):
+        js["anyOf"].append({"type": "string"})
+    with pytest.raises(TypeError):
+        js["anyOf"][1]["properties"]["c"] = {"type": "string"}
+    with pytest.raises(TypeError):
+        js["anyOf"][1]["required"].clear()
+    assert schema.to_jsonschema() == _schema().to_jsonschema()
+
+
+def test_to_jsonschema_top_level_is_editable():
+    schema = _schema()
+    for s in (schema, schema.variants[1], schema.variants[1].properties["a"]):
+        js = s.to_jsonschema()
+        assert type(js) is dict
+        js["$schema"] = "https://json-schema.org/draft/2020-12/schema"
+        assert "$schema" not in s.to_jsonschema()
+    leaf = schema.variants[0].to_jsonschema()
+    assert type(leaf) is dict
+    leaf["$schema"] = "x"
+
+
+def test_to_jsonschema_deepcopy_is_editable():
+    js = copy.deepcopy(_schema().to_jsonschema())
+    assert type(js) is dict and type(js["anyOf"]) is list
+    js["anyOf"].append({"type": "string"})
+    js["$schema"] = "https://json-schema.org/draft/2020-12/schema"
+    assert len(_schema().to_jsonschema()["anyOf"]) == 2
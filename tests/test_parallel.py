@@ -0,0 +1,25 @@
+import pytest
+
+from schema_infer import deduce_schema, deduce_schema_parallel
+
+
+def test_small_input_matches_deduce_schema():
+    values = [1, 2.5, None, "x", {"a": 1}]
+    assert deduce_schema_parallel(values) == deduce_schema(values)
+    assert deduce_schema_parallel([]) == deduce_schema([])
+
+
+def test_chunked_scalars_match_deduce_schema():
+    values = [i if i % 3 else None for i in range(100)] + [1.5, "x"]
+    assert deduce_schema_parallel(values, workers=2, chunk=10) == deduce_schema(values)
+
+
+def test_chunked_records_match_deduce_schema():
+    values = [{"a": i, "b": "x" if i % 2 else None, **({"c": [1.5]} if i % 7 else {})} for i in range(100)]
+    assert deduce_schema_parallel(values, workers=2, chunk=10) == deduce_schema(values)
+
+
+@pytest.mark.parametrize("chunk", [0, -1])
+def test_chunk_must_be_positive(chunk):
+    with pytest.raises(ValueError):
+        deduce_schema_parallel([1, 2, 3], chunk=chunk)
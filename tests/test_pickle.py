@@ -0,0 +1,78 @@
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from schema_infer import (
+    IntSchema,
+    NullSchema,
+    ObjectSchema,
+    Schema,
+    StringSchema,
+    coerce_to_schema,
+    deduce_schema,
+)
+
+
+def _warm(schema):
+    # Populate the lazily cached repr / JSON-Schema / dispatch slots.
+    repr(schema)
+    schema.to_jsonschema()
+    for variant in getattr(schema, "variants", ()):
+        repr(variant)
+        variant.to_jsonschema()
+    coerce_to_schema(None, schema)
+    return schema
+
+
+def test_pickle_and_copy_with_populated_caches():
+    schema = _warm(deduce_schema([{"a": 1, "b": [1.5, None]}, {"a": "x"}, None, [1], (2,)]))
+    for clone in (
+        pickle.loads(pickle.dumps(schema)),
+        copy.copy(schema),
+        copy.deepcopy(schema),
+    ):
+        assert clone == schema
+        assert repr(clone) == repr(schema)
+        assert clone.to_jsonschema() == schema.to_jsonschema()
+
+
+def test_leaf_schemas_stay_singletons():
+    assert pickle.loads(pickle.dumps(NullSchema())) is NullSchema()
+    assert copy.deepcopy(IntSchema()) is IntSchema()
+
+
+def test_object_schema_asdict_and_immutability():
+    schema = ObjectSchema({"a": IntSchema(), "b": StringSchema()}, {"b"})
+    assert dataclasses.asdict(schema) == {"properties": {"a": {}, "b": {}}, "optional": {"b"}}
+    assert pickle.loads(pickle.dumps(schema)) == schema
+    assert hash(schema) == hash(ObjectSchema({"b": StringSchema(), "a": IntSchema()}, ["b"]))
+    with pytest.raises(TypeError):
+        schema.properties["c"] = IntSchema()
+
+
+class Email(Schema):
+    """A user-defined, non-dataclass schema."""
+
+    def __repr__(self):
+        return "Email"
+
+    def __eq__(self, other):
+        return type(other) is Email
+
+    def __hash__(self):
+        return hash(Email)
+
+
+@dataclasses.dataclass(frozen=True)
+class Tagged(Schema):
+    tag: str = "t"
+    label: str = dataclasses.field(init=False, default="computed")
+
+
+@pytest.mark.parametrize("schema", [Email(), Tagged("x"), ObjectSchema({"a": Email(), "b": Tagged()}, set())])
+def test_custom_subclasses_pickle_and_copy(schema):
+    for clone in (pickle.loads(pickle.dumps(schema)), copy.copy(schema), copy.deepcopy(schema)):
+        assert clone == schema
+        assert repr(clone) == repr(schema)